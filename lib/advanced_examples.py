@@ -5,6 +5,16 @@ Demonstrates more specific web scraping techniques and edge cases.
 
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+
+# Parser backend shared by every BeautifulSoup() call below
+PARSER = 'lxml'
+
+# Reused across requests so each host only pays for one TCP/TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.headers.update({'user-agent': 'my-app/0.0.1'})
 
 
 def demonstrate_css_selectors():
@@ -37,7 +47,7 @@ def demonstrate_css_selectors():
     </html>
     """
     
-    doc = BeautifulSoup(sample_html, 'html.parser')
+    doc = BeautifulSoup(sample_html, PARSER)
     
     # 1. Select by ID
     main_content = doc.select('#main-content')
@@ -97,7 +107,7 @@ def demonstrate_element_methods():
     </div>
     """
     
-    doc = BeautifulSoup(sample_html, 'html.parser')
+    doc = BeautifulSoup(sample_html, PARSER)
     course_card = doc.select_one('#course-card')  # select_one returns first match
     
     if course_card:
@@ -118,9 +128,8 @@ def demonstrate_element_methods():
         print(f"All text (.get_text()): {course_card.get_text(strip=True)}")
         print(f"All text (.text): {course_card.text.strip()}")
         
-        # 5. Direct string content only (no nested tags)
-        strings = list(course_card.strings)
-        print(f"All strings: {[s.strip() for s in strings if s.strip()]}")
+        # 5. Every text string, already stripped with blank ones skipped
+        print(f"All strings: {list(course_card.stripped_strings)}")
         
         # 6. Find specific child elements
         title = course_card.find('h3')
@@ -134,6 +143,8 @@ def demonstrate_element_methods():
             print(f"  {i}. {feature.get_text(strip=True)}")
         
         # 8. Navigate the tree structure
+        # lxml wraps HTML fragments in <html><body>, so the parent here is 'body'
+        # ('html.parser' would report the '[document]' root instead)
         print(f"Parent element: {course_card.parent.name if course_card.parent else 'None'}")
         
         children = list(course_card.children)
@@ -153,16 +164,14 @@ def scrape_with_error_handling():
         "https://this-domain-does-not-exist.invalid",  # Will fail DNS lookup
     ]
     
-    headers = {'user-agent': 'my-app/0.0.1'}
-    
     for url in urls_to_try:
         print(f"\nTrying to scrape: {url}")
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             response.raise_for_status()  # Raises HTTPError for bad responses
             
-            doc = BeautifulSoup(response.text, 'html.parser')
+            doc = BeautifulSoup(response.text, PARSER)
             
             # Try to extract some basic info
             title = doc.find('title')
@@ -214,7 +223,7 @@ def demonstrate_iterating_elements():
     </div>
     """
     
-    doc = BeautifulSoup(sample_html, 'html.parser')
+    doc = BeautifulSoup(sample_html, PARSER)
     
     # Find all course elements
     courses = doc.select('.course')
@@ -231,14 +240,24 @@ def demonstrate_iterating_elements():
     course_data = []
     
     for course in courses:
-        # Always check if elements exist before accessing their properties
-        title_elem = course.find('h3')
-        duration_elem = course.find('.duration')
-        price_elem = course.find('.price')
+        # Collect each field's text in a single pass over the course, matching
+        # on tag name and class membership (like find('p', class_='duration')).
+        # setdefault keeps the first match, so a nested element can't
+        # overwrite an earlier one.
+        fields = {}
+        for elem in course.find_all(['h3', 'p', 'span']):
+            classes = elem.get('class', [])
+            if elem.name == 'h3':
+                fields.setdefault('title', elem.get_text(strip=True))
+            elif elem.name == 'p' and 'duration' in classes:
+                fields.setdefault('duration', elem.get_text(strip=True))
+            elif elem.name == 'span' and 'price' in classes:
+                fields.setdefault('price', elem.get_text(strip=True))
         
-        title = title_elem.get_text(strip=True) if title_elem else "No title"
-        duration = duration_elem.get_text(strip=True) if duration_elem else "Duration not specified"
-        price = price_elem.get_text(strip=True) if price_elem else "Price not listed"
+        # Always check if elements exist before accessing their properties
+        title = fields.get('title', "No title")
+        duration = fields.get('duration', "Duration not specified")
+        price = fields.get('price', "Price not listed")
         level = course.get('data-level', 'Not specified')
         
         course_info = {
@@ -259,10 +278,8 @@ def demonstrate_iterating_elements():
     
     # Method 3: Using enumerate for numbering
     print("3. Numbered list with enumerate:")
-    for index, course in enumerate(courses):
-        title = course.find('h3').get_text(strip=True)
-        level = course.get('data-level')
-        print(f"   {index + 1}. {title} ({level})")
+    for index, course in enumerate(course_data):
+        print(f"   {index + 1}. {course['title']} ({course['level']})")
 
 
 def main():
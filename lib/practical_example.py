@@ -3,180 +3,333 @@ Practical Web Scraping Example
 A real-world scenario demonstrating how to build a complete web scraper.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+import soupsieve as sv
+from requests.adapters import HTTPAdapter
 import csv
 import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from urllib.parse import urljoin, urlparse
 
+try:
+    import orjson
+except ImportError:  # installed via the Pipfile; fall back to the standard library
+    orjson = None
 
-def scrape_quotes_to_scrape():
+# Parser backend shared by every BeautifulSoup() call below
+PARSER = 'lxml'
+
+# Only build the parts of each page we actually read
+QUOTE_STRAINER = SoupStrainer(class_=['quote', 'next'])
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# CSS selectors compiled once instead of on every .select() call
+_SEL_QUOTE = sv.compile('.quote')
+_SEL_QUOTE_FIELDS = sv.compile('.text, .author, .tag')
+_SEL_NEXT = sv.compile('.next')
+
+# Number of pages requested concurrently
+MAX_WORKERS = 8
+
+# Shared session so repeated requests to the same host reuse connections
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.headers.update({'user-agent': 'learning-scraper/1.0'})
+
+
+def _to_json(obj, indent=False):
+    """
+    Serializes obj to UTF-8 encoded JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    # Compact separators match orjson's output
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _fetch_quotes_page(base_url, page):
+    """
+    Fetches one page of quotes and parses the parts we read from it.
+    """
+    response = _SESSION.get(f"{base_url}/page/{page}/", timeout=10)
+    response.raise_for_status()
+    return BeautifulSoup(response.text, PARSER, parse_only=QUOTE_STRAINER)
+
+
+def _find_last_page(base_url, docs):
+    """
+    Finds the number of the last page of quotes (0 if there are none).
+    
+    Page numbers are doubled until a page past the end is found, then the gap
+    is bisected. A page with quotes but no next link is the last page, so the
+    search stops as soon as one is seen. Every parsed page with quotes is
+    stored in `docs` so it doesn't have to be fetched again.
+    
+    A probe that fails is treated like a page past the end, so a network error
+    shortens the crawl instead of discarding the pages already fetched.
+    """
+    last_known = 0  # highest page known to have a next link
+    past_end = None  # lowest page known to have no quotes (or that failed)
+    page = 1
+    
+    while past_end is None or past_end - last_known > 1:
+        try:
+            doc = _fetch_quotes_page(base_url, page)
+        except requests.RequestException as e:
+            print(f"Error scraping page {page}: {e}")
+            doc = None
+        
+        if doc is None or not _SEL_QUOTE.select(doc):
+            past_end = page
+        else:
+            docs[page] = doc
+            if not _SEL_NEXT.select_one(doc):
+                return page
+            last_known = page
+        
+        page = page * 2 if past_end is None else (last_known + past_end) // 2
+    
+    return last_known
+
+
+def iter_quotes():
     """
     Scrapes quotes from quotes.toscrape.com - a site designed for practicing scraping.
     This demonstrates a complete scraping workflow.
+    
+    Quotes are yielded one at a time as each page is parsed, so callers can
+    write them out without holding the whole collection in memory.
     """
     print("=== Scraping Quotes from quotes.toscrape.com ===")
     
     base_url = "http://quotes.toscrape.com"
-    headers = {'user-agent': 'learning-scraper/1.0'}
-    
-    all_quotes = []
-    page = 1
     
-    while True:
-        url = f"{base_url}/page/{page}/"
-        print(f"Scraping page {page}...")
-        
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+    total_quotes = 0
+    
+    # Find out how many pages there are first, so we never request pages
+    # past the end (pages fetched while probing are kept and reused)
+    docs = {}
+    last_page = _find_last_page(base_url, docs)
+    print(f"Found {last_page} pages of quotes")
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for first_page in range(1, last_page + 1, MAX_WORKERS):
+            # Fetch a batch of pages at once so the network waits overlap,
+            # then parse them in page order
+            pages = range(first_page, min(first_page + MAX_WORKERS, last_page + 1))
+            to_fetch = [page for page in pages if page not in docs]
+            if to_fetch:
+                print(f"Scraping pages {', '.join(map(str, to_fetch))}...")
+            fetched = executor.map(lambda page: _fetch_quotes_page(base_url, page), to_fetch)
             
-            doc = BeautifulSoup(response.text, 'html.parser')
+            finished = False
+            for page in pages:
+                try:
+                    doc = docs.pop(page) if page in docs else next(fetched)
+                    
+                    # Find all quote containers
+                    quotes = _SEL_QUOTE.select(doc)
+                    
+                    if not quotes:
+                        print("No more quotes found. Scraping complete!")
+                        finished = True
+                        break
+                    
+                    for quote in quotes:
+                        # Extract the text, author and tags in a single walk
+                        # over the quote, dispatching on each element's class
+                        text = author = None
+                        tags = []
+                        for elem in _SEL_QUOTE_FIELDS.select(quote):
+                            classes = elem.get('class', [])
+                            if 'tag' in classes:
+                                tags.append(elem.get_text(strip=True))
+                            elif 'author' in classes and author is None:
+                                author = elem.get_text(strip=True)
+                            elif 'text' in classes and text is None:
+                                text = elem.get_text(strip=True)
+                        
+                        if text is None:
+                            text = "No text"
+                        if author is None:
+                            author = "Unknown"
+                        
+                        quote_data = {
+                            'text': text,
+                            'author': author,
+                            'tags': tags,
+                            'page': page
+                        }
+                        
+                        total_quotes += 1
+                        yield quote_data
+                    
+                    print(f"  Found {len(quotes)} quotes on page {page}")
+                    
+                    if page == last_page:
+                        print("Reached the last page!")
+                    
+                except requests.RequestException as e:
+                    print(f"Error scraping page {page}: {e}")
+                    finished = True
+                    break
             
-            # Find all quote containers
-            quotes = doc.select('.quote')
-            
-            if not quotes:
-                print("No more quotes found. Scraping complete!")
+            if finished:
                 break
             
-            for quote in quotes:
-                # Extract quote text
-                text_elem = quote.select_one('.text')
-                text = text_elem.get_text(strip=True) if text_elem else "No text"
-                
-                # Extract author
-                author_elem = quote.select_one('.author')
-                author = author_elem.get_text(strip=True) if author_elem else "Unknown"
-                
-                # Extract tags
-                tag_elements = quote.select('.tag')
-                tags = [tag.get_text(strip=True) for tag in tag_elements]
-                
-                quote_data = {
-                    'text': text,
-                    'author': author,
-                    'tags': tags,
-                    'page': page
-                }
-                
-                all_quotes.append(quote_data)
-                print(f"  Found quote by {author}")
-            
-            # Check if there's a next page
-            next_btn = doc.select_one('.next')
-            if not next_btn:
-                print("Reached the last page!")
-                break
-                
-            page += 1
+            if pages.stop <= last_page:
+                # Be respectful - add a small delay between batches
+                time.sleep(0.5)
+    
+    print(f"\nScraping completed! Total quotes collected: {total_quotes}")
+
+
+def stream_quotes_to_files(quotes, jsonl_filename="quotes.jsonl", csv_filename="quotes.csv"):
+    """
+    Writes each quote to a JSON Lines file and a CSV file as soon as it arrives.
+    Returns the number of quotes written. If there are none, the existing
+    files are left untouched.
+    """
+    # Wait for the first quote before opening (and truncating) the files
+    quotes = iter(quotes)
+    first_quote = next(quotes, None)
+    if first_quote is None:
+        print(f"No quotes scraped - leaving {jsonl_filename} and {csv_filename} unchanged")
+        return 0
+    
+    count = 0
+    with open(jsonl_filename, 'wb') as jsonl_file, \
+            open(csv_filename, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=['text', 'author', 'tags', 'page'])
+        writer.writeheader()
+        
+        for quote in chain([first_quote], quotes):
+            jsonl_file.write(_to_json(quote) + b'\n')
             
-            # Be respectful - add a small delay
-            import time
-            time.sleep(0.5)
+            # Convert tags list to string for CSV
+            csv_quote = quote.copy()
+            csv_quote['tags'] = ', '.join(quote['tags'])
+            writer.writerow(csv_quote)
             
-        except requests.RequestException as e:
-            print(f"Error scraping page {page}: {e}")
-            break
+            count += 1
     
-    print(f"\nScraping completed! Total quotes collected: {len(all_quotes)}")
-    return all_quotes
+    print(f"Saved {count} quotes to {jsonl_filename} and {csv_filename}")
+    return count
+
+
+def load_quotes(jsonl_filename="quotes.jsonl"):
+    """
+    Reads quotes back from a JSON Lines file one at a time.
+    """
+    with open(jsonl_filename, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line) if orjson is not None else json.loads(line)
 
 
 def analyze_scraped_data(quotes):
     """
     Analyzes the scraped quotes data to show insights.
+    Works in a single pass, so `quotes` can be any iterable (e.g. load_quotes()).
     """
     print("\n=== Data Analysis ===")
     
-    if not quotes:
-        print("No quotes to analyze!")
-        return
+    author_counts = Counter()
+    tag_counts = Counter()
+    shortest = longest = None
+    shortest_length = longest_length = 0
     
-    # Count quotes by author
-    author_counts = {}
     for quote in quotes:
-        author = quote['author']
-        author_counts[author] = author_counts.get(author, 0) + 1
+        # Count quotes by author and tag frequency
+        author_counts[quote['author']] += 1
+        tag_counts.update(quote['tags'])
+        
+        # Track the shortest and longest quotes, comparing against cached lengths
+        length = len(quote['text'])
+        if shortest is None or length < shortest_length:
+            shortest, shortest_length = quote, length
+        if longest is None or length >= longest_length:
+            longest, longest_length = quote, length
+    
+    if shortest is None:
+        print("No quotes to analyze!")
+        return
     
     print("Top authors by number of quotes:")
-    sorted_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)
-    for author, count in sorted_authors[:5]:
+    for author, count in author_counts.most_common(5):
         print(f"  {author}: {count} quotes")
     
-    # Collect all tags
-    all_tags = []
-    for quote in quotes:
-        all_tags.extend(quote['tags'])
-    
-    # Count tag frequency
-    tag_counts = {}
-    for tag in all_tags:
-        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-    
     print(f"\nMost common tags:")
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-    for tag, count in sorted_tags[:10]:
+    for tag, count in tag_counts.most_common(10):
         print(f"  {tag}: {count} times")
     
-    # Find longest and shortest quotes
-    quote_lengths = [(len(quote['text']), quote['text'], quote['author']) for quote in quotes]
-    quote_lengths.sort(key=lambda x: x[0])
-    
-    shortest = quote_lengths[0]
-    longest = quote_lengths[-1]
-    
-    print(f"\nShortest quote ({shortest[0]} chars) by {shortest[2]}:")
-    print(f"  \"{shortest[1]}\"\n")
+    print(f"\nShortest quote ({shortest_length} chars) by {shortest['author']}:")
+    print(f"  \"{shortest['text']}\"\n")
     
-    print(f"Longest quote ({longest[0]} chars) by {longest[2]}:")
-    print(f"  \"{longest[1][:100]}...\"" if len(longest[1]) > 100 else f"  \"{longest[1]}\"")
+    longest_text = longest['text']
+    print(f"Longest quote ({longest_length} chars) by {longest['author']}:")
+    print(f"  \"{longest_text[:100]}...\"" if longest_length > 100 else f"  \"{longest_text}\"")
 
 
 def save_data_to_files(quotes):
     """
-    Saves the scraped data in multiple formats.
+    Saves the scraped data as a JSON document and a text summary.
+    Quotes are written as they are read, so `quotes` can be any iterable.
+    (The CSV file is written while scraping by stream_quotes_to_files().)
     """
     print("\n=== Saving Data ===")
     
-    if not quotes:
+    quotes = iter(quotes)
+    first_quote = next(quotes, None)
+    if first_quote is None:
         print("No quotes to save!")
         return
     
-    # Save as JSON
+    total = 0
+    authors = set()
+    samples = []
+    
+    # Save as JSON, one array element at a time
     json_filename = "quotes.json"
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(quotes, f, indent=2, ensure_ascii=False)
-    print(f"Saved {len(quotes)} quotes to {json_filename}")
-    
-    # Save as CSV
-    csv_filename = "quotes.csv"
-    with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-        if quotes:
-            writer = csv.DictWriter(f, fieldnames=['text', 'author', 'tags', 'page'])
-            writer.writeheader()
+    with open(json_filename, 'wb') as f:
+        f.write(b'[')
+        for quote in chain([first_quote], quotes):
+            if total:
+                f.write(b',')
+            # Serializing a one-element list and dropping its brackets gives
+            # the element already indented for its place in the array
+            f.write(_to_json([quote], indent=True)[1:-2])
             
-            for quote in quotes:
-                # Convert tags list to string for CSV
-                csv_quote = quote.copy()
-                csv_quote['tags'] = ', '.join(quote['tags'])
-                writer.writerow(csv_quote)
-    
-    print(f"Saved {len(quotes)} quotes to {csv_filename}")
+            total += 1
+            authors.add(quote['author'])
+            if len(samples) < 5:
+                samples.append(quote)
+        f.write(b'\n]')
+    print(f"Saved {total} quotes to {json_filename}")
     
     # Save a simple text summary
     txt_filename = "quotes_summary.txt"
+    lines = [
+        "QUOTES COLLECTION SUMMARY",
+        "=" * 30,
+        "",
+        f"Total quotes: {total}",
+        f"Unique authors: {len(authors)}",
+        "",
+        "Sample quotes:",
+    ]
+    lines.extend(f"{i}. \"{quote['text']}\" - {quote['author']}" for i, quote in enumerate(samples, 1))
+    
+    # Build the whole summary first so it goes out in a single write
     with open(txt_filename, 'w', encoding='utf-8') as f:
-        f.write("QUOTES COLLECTION SUMMARY\n")
-        f.write("=" * 30 + "\n\n")
-        f.write(f"Total quotes: {len(quotes)}\n")
-        
-        authors = set(quote['author'] for quote in quotes)
-        f.write(f"Unique authors: {len(authors)}\n\n")
-        
-        f.write("Sample quotes:\n")
-        for i, quote in enumerate(quotes[:5], 1):
-            f.write(f"{i}. \"{quote['text']}\" - {quote['author']}\n")
+        f.write('\n'.join(lines) + '\n')
     
     print(f"Saved summary to {txt_filename}")
 
@@ -202,7 +355,7 @@ def scrape_with_session():
             response = session.get(url)
             response.raise_for_status()
             
-            doc = BeautifulSoup(response.text, 'html.parser')
+            doc = BeautifulSoup(response.text, PARSER)
             
             # Count quotes on this page
             quotes = doc.select('.quote')
@@ -222,31 +375,30 @@ def demonstrate_link_extraction():
     """
     print("\n=== Link Extraction Demo ===")
     
-    headers = {'user-agent': 'learning-scraper/1.0'}
-    
     try:
-        response = requests.get("http://quotes.toscrape.com/", headers=headers)
+        response = _SESSION.get("http://quotes.toscrape.com/", timeout=10)
         response.raise_for_status()
         
-        doc = BeautifulSoup(response.text, 'html.parser')
+        doc = BeautifulSoup(response.text, PARSER, parse_only=LINK_STRAINER)
         base_url = "http://quotes.toscrape.com"
         
         # Find all links
-        links = doc.select('a[href]')
+        links = doc.find_all('a', href=True)
         
         print(f"Found {len(links)} links:")
         
-        unique_links = set()
+        # Maps each absolute URL to the text of the first link pointing at it
+        unique_links = {}
         for link in links:
-            href = link.get('href')
-            text = link.get_text(strip=True)
+            href = link['href']
             
             # Convert relative URLs to absolute URLs
-            full_url = urljoin(base_url, href)
+            full_url = href if href.startswith(('http://', 'https://')) else urljoin(base_url, href)
             
             if full_url not in unique_links:
-                unique_links.add(full_url)
-                print(f"  '{text}' -> {full_url}")
+                unique_links[full_url] = link.get_text(strip=True)
+        
+        print('\n'.join(f"  '{text}' -> {full_url}" for full_url, text in unique_links.items()))
         
         print(f"\nTotal unique links: {len(unique_links)}")
         
@@ -261,14 +413,15 @@ def main():
     print("Practical Web Scraping Example")
     print("=" * 50)
     
-    # Scrape the quotes
-    quotes = scrape_quotes_to_scrape()
+    # Scrape the quotes, writing each one to disk as it is found
+    count = stream_quotes_to_files(iter_quotes())
     
-    # Analyze the data
-    analyze_scraped_data(quotes)
+    # Analyze the data (read back from disk, but only if this run found any,
+    # so a failed scrape never reuses a previous run's quotes.jsonl)
+    analyze_scraped_data(load_quotes() if count else [])
     
     # Save the data
-    save_data_to_files(quotes)
+    save_data_to_files(load_quotes() if count else [])
     
     # Demonstrate session usage
     scrape_with_session()
@@ -1,6 +1,50 @@
 from bs4 import BeautifulSoup
+import os
+import re
 import requests
 
+try:
+    import requests_cache
+except ImportError:  # installed via the Pipfile; without it pages aren't cached
+    requests_cache = None
+
+# lxml parses with libxml2 and is much faster than the pure-Python 'html.parser'
+PARSER = 'lxml'
+
+# Matches any class name containing "course" (e.g. course-title, course-card)
+_COURSE_RE = re.compile(r'course')
+
+
+def _is_course_element(tag):
+    """
+    True for h2/h3 headings and for elements with a course-related class.
+    """
+    return tag.name in ('h2', 'h3') or any(_COURSE_RE.search(name) for name in tag.get('class', []))
+
+
+# Responses are cached on disk next to this module for an hour so repeated
+# runs don't hit the network
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scrape_cache')
+
+_SESSION = None
+
+
+def _get_session():
+    """
+    Returns the shared session, creating it (and its cache) on first use
+    rather than when the module is imported.
+    """
+    global _SESSION
+    if _SESSION is None:
+        if requests_cache is not None:
+            _SESSION = requests_cache.CachedSession(_CACHE_PATH, expire_after=3600)
+        else:
+            _SESSION = requests.Session()
+        
+        # Set up headers once on the session to avoid bot detection
+        _SESSION.headers.update({'user-agent': 'my-app/0.0.1'})
+    return _SESSION
+
 
 def scrape_flatiron_homepage():
     """
@@ -9,22 +53,19 @@ def scrape_flatiron_homepage():
     """
     print("=== Scraping Flatiron School Homepage ===")
     
-    # Set up headers to avoid bot detection
-    headers = {'user-agent': 'my-app/0.0.1'}
-    
     try:
         # Make HTTP request to get the HTML content
-        html = requests.get("https://flatironschool.com/", headers=headers)
+        html = _get_session().get("https://flatironschool.com/", timeout=10)
         html.raise_for_status()  # Raise exception for bad status codes
         
         # Create Beautiful Soup object to parse HTML
-        doc = BeautifulSoup(html.text, 'html.parser')
+        doc = BeautifulSoup(html.text, PARSER)
         
         print(f"Successfully retrieved HTML content ({len(html.text)} characters)")
         
-        # Example 1: Extract specific text using CSS selector
-        # Look for headings with specific classes
-        headings = doc.select('h1, h2, h3')  # Get all h1, h2, h3 elements
+        # Example 1: Extract all headings
+        # A plain list of tag names doesn't need a CSS selector
+        headings = doc.find_all(['h1', 'h2', 'h3'])  # Get all h1, h2, h3 elements
         
         if headings:
             print(f"\nFound {len(headings)} headings:")
@@ -58,31 +99,24 @@ def scrape_flatiron_courses():
     """
     print("\n=== Scraping Flatiron School Courses ===")
     
-    headers = {'user-agent': 'my-app/0.0.1'}
-    
     try:
         # Scrape the courses page
-        html = requests.get("https://flatironschool.com/our-courses/", headers=headers)
+        html = _get_session().get("https://flatironschool.com/our-courses/", timeout=10)
         html.raise_for_status()
         
-        doc = BeautifulSoup(html.text, 'html.parser')
+        doc = BeautifulSoup(html.text, PARSER)
         
-        # Look for course-related headings and content
-        course_elements = doc.select('h2, h3, .course-title, [class*="course"]')
+        # Look for course-related headings and content in a single walk.
+        # Each element is tested once, so an element matching both conditions
+        # isn't listed twice, and identical-looking elements stay separate
+        # (unlike dict.fromkeys(), which would merge Tags with equal markup).
+        course_elements = doc.find_all(_is_course_element)
         
         print(f"Found {len(course_elements)} course-related elements:")
         
-        courses_found = []
-        for element in course_elements:
-            text = element.get_text(strip=True)
-            if text and len(text) > 3:  # Filter out very short text
-                courses_found.append(text)
-        
-        # Remove duplicates while preserving order
-        unique_courses = []
-        for course in courses_found:
-            if course not in unique_courses:
-                unique_courses.append(course)
+        # Filter out very short text and remove duplicates while preserving order
+        texts = (element.get_text(strip=True) for element in course_elements)
+        unique_courses = list(dict.fromkeys(text for text in texts if text and len(text) > 3))
         
         for i, course in enumerate(unique_courses[:10]):  # Show first 10
             print(f"{i+1}. {course}")
@@ -144,14 +178,12 @@ def scrape_example_site():
     """
     print("\n=== Scraping Example Site (httpbin.org) ===")
     
-    headers = {'user-agent': 'my-app/0.0.1'}
-    
     try:
         # Use httpbin.org/html which returns a simple HTML page
-        html = requests.get("http://httpbin.org/html", headers=headers)
+        html = _get_session().get("http://httpbin.org/html", timeout=10)
         html.raise_for_status()
         
-        doc = BeautifulSoup(html.text, 'html.parser')
+        doc = BeautifulSoup(html.text, PARSER)
         
         print("Successfully scraped httpbin.org/html")
         print(f"Page title: {doc.title.string if doc.title else 'No title found'}")
@@ -198,7 +230,7 @@ def main():
     print("\n" + "=" * 50)
     print("Scraping demonstration completed!")
     print("\nKey takeaways:")
-    print("- Use requests.get() to fetch HTML content")
+    print("- Reuse one requests Session (with shared headers) to fetch HTML content")
     print("- Use BeautifulSoup() to parse HTML into a navigable structure")
     print("- Use CSS selectors with .select() to find specific elements")
     print("- Use .get_text() to extract text content from elements")
@@ -0,0 +1,84 @@
+import pytest
+import requests
+
+import practical_example
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+def fake_site(last_page, failing_pages=()):
+    """Returns a fake session.get for a quotes site with `last_page` pages"""
+    requested = []
+
+    def get(url, timeout=None):
+        page = int(url.rstrip('/').rsplit('/', 1)[-1])
+        requested.append(page)
+        if page in failing_pages:
+            raise requests.ConnectionError(f"page {page} failed")
+
+        body = ''
+        if page <= last_page:
+            body = ''.join(
+                f'<div class="quote"><span class="text">Quote {page}.{i}</span>'
+                f'<small class="author">Author {i}</small>'
+                f'<a class="tag" href="/tag/t{i}/">t{i}</a></div>'
+                for i in range(2)
+            )
+            if page < last_page:
+                body += f'<li class="next"><a href="/page/{page + 1}/">Next</a></li>'
+        return FakeResponse(f'<html><body>{body}</body></html>')
+
+    get.requested = requested
+    return get
+
+
+@pytest.fixture(autouse=True)
+def no_delay(monkeypatch):
+    monkeypatch.setattr(practical_example.time, 'sleep', lambda seconds: None)
+
+
+@pytest.mark.parametrize('last_page', [0, 1, 8, 9, 10])
+def test_iter_quotes_scrapes_every_page_once(monkeypatch, last_page):
+    """Every page is scraped exactly once and nothing far past the end is requested"""
+    get = fake_site(last_page)
+    monkeypatch.setattr(practical_example._SESSION, 'get', get)
+
+    quotes = list(practical_example.iter_quotes())
+
+    assert [quote['page'] for quote in quotes] == [page for page in range(1, last_page + 1) for _ in range(2)]
+    assert quotes[:1] == ([{'text': 'Quote 1.0', 'author': 'Author 0', 'tags': ['t0'], 'page': 1}] if last_page else [])
+    assert len(get.requested) == len(set(get.requested))
+    assert set(range(1, last_page + 1)) <= set(get.requested)
+    assert all(page <= 2 * max(last_page, 1) for page in get.requested)
+
+
+def test_iter_quotes_keeps_pages_when_a_probe_fails(monkeypatch):
+    """A failed probe past the end doesn't throw away the pages already fetched"""
+    monkeypatch.setattr(practical_example._SESSION, 'get', fake_site(10, failing_pages={16}))
+
+    quotes = list(practical_example.iter_quotes())
+
+    assert sorted({quote['page'] for quote in quotes}) == list(range(1, 11))
+    assert len(quotes) == 20
+
+
+def test_empty_scrape_leaves_saved_files_untouched(monkeypatch, tmp_path):
+    """A scrape that finds nothing doesn't overwrite the previous run's output"""
+    monkeypatch.chdir(tmp_path)
+    for filename in ['quotes.jsonl', 'quotes.csv', 'quotes.json', 'quotes_summary.txt']:
+        (tmp_path / filename).write_text('previous run\n', encoding='utf-8')
+    monkeypatch.setattr(practical_example._SESSION, 'get', fake_site(0))
+
+    assert practical_example.stream_quotes_to_files(practical_example.iter_quotes()) == 0
+    practical_example.save_data_to_files([])
+
+    for filename in ['quotes.jsonl', 'quotes.csv', 'quotes.json', 'quotes_summary.txt']:
+        assert (tmp_path / filename).read_text(encoding='utf-8') == 'previous run\n'